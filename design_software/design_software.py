@@ -5,13 +5,15 @@
 Spiral Robot Design Tool
 """
 
+import functools
+import itertools
 import math
 import os
 import sys
 import warnings
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # 过滤常见警告
 warnings.filterwarnings('ignore', category=UserWarning)
@@ -27,9 +29,7 @@ warnings.filterwarnings('ignore', message='.*Glyph.*missing.*')
 os.environ['QT_LOGGING_RULES'] = '*.debug=false;qt.qpa.*=false'
 
 from PySide6.QtCore import Qt, QTimer, Signal, QPoint
-from PySide6.QtGui import QPainter
-from PySide6.QtCore import QMarginsF
-from PySide6.QtPrintSupport import QPrinter
+from PySide6.QtGui import QColor, QPainter
 from PySide6.QtWidgets import (
     QApplication,
     QDoubleSpinBox,
@@ -47,9 +47,11 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+import numpy as np
+
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
-import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 
 # 配置matplotlib支持中文显示
@@ -59,8 +61,17 @@ plt.rcParams['axes.unicode_minus'] = False
 
 Point2D = Tuple[float, float]
 
+try:
+    # Numba 可选加速；cache=True 避免每次启动的冷编译
+    from numba import njit as _njit
+except ImportError:
+    def _njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 
-@dataclass
+@dataclass(slots=True)
 class Params:
     a: float = 4.95
     b: float = 0.1764
@@ -70,6 +81,7 @@ class Params:
     elastic_percent: float = 5.0
     elastic_enabled: bool = True
     extrusion: float = 1.0
+    extrusion_clamped: float = 1.0
     cone_angle1: float = 5.0
     cone_angle2: float = 15.0
     tip_hole_pos: float = 50.0
@@ -93,8 +105,9 @@ class ToggleSwitch(QWidget):
         super().__init__(parent)
         self.setFixedSize(46, 24)
         self._checked = checked
-        self._on_color = on_color
-        self._off_color = off_color
+        self._on_qc = QColor(on_color)
+        self._off_qc = QColor(off_color)
+        self._knob_qc = QColor("#f8f9fb")
         self.setCursor(Qt.PointingHandCursor) # type: ignore
 
     def isChecked(self) -> bool:
@@ -110,90 +123,124 @@ class ToggleSwitch(QWidget):
         self.toggled.emit(self._checked)
 
     def paintEvent(self, event) -> None:
-        from PySide6.QtGui import QPainter, QColor
-
+        w = self.width()
+        h = self.height()
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing) # type: ignore
-        bg = QColor(self._on_color) if self._checked else QColor(self._off_color)
-        p.setBrush(bg)
+        p.setBrush(self._on_qc if self._checked else self._off_qc)
         p.setPen(Qt.NoPen) # type: ignore
-        p.drawRoundedRect(0, 0, self.width(), self.height(), 12, 12)
-        knob_x = self.width() - 22 if self._checked else 2
-        p.setBrush(QColor("#f8f9fb"))
+        p.drawRoundedRect(0, 0, w, h, 12, 12)
+        knob_x = w - 22 if self._checked else 2
+        p.setBrush(self._knob_qc)
         p.drawEllipse(knob_x, 2, 20, 20)
 
 
-def _polar_to_cart(theta: float, r: float) -> Point2D:
-    return (r * math.cos(theta), r * math.sin(theta))
-
+def _poly_points(poly) -> List[Point2D]:
+    """ndarray 四边形顶点转为 CadQuery polyline 需要的元组列表。"""
+    return [(float(x), float(y)) for x, y in poly]
 
-def _cart_to_polar(x: float, y: float) -> Point2D:
-    r = math.hypot(x, y)
-    theta = math.atan2(y, x)
-    if theta < 0:
-        theta += 2.0 * math.pi
-    return (theta, r)
 
+def _clip_rays(start: Point2D, ends: List[Point2D], x_max: float) -> np.ndarray:
+    """把一组射线端点裁剪到 x<=x_max，一次向量化处理替代逐条分支。"""
+    s = np.asarray(start, dtype=np.float64)
+    e = np.asarray(ends, dtype=np.float64)
+    t = np.clip((x_max - s[0]) / (e[:, 0] - s[0] + 1e-300), 0.0, 1.0)
+    t = np.where(e[:, 0] <= x_max, 1.0, t)
+    return s + t[:, None] * (e - s)
 
-def _reflect_point_across_line(p: Point2D, a: Point2D, b: Point2D) -> Point2D:
-    px, py = p
-    ax, ay = a
-    bx, by = b
-    vx = bx - ax
-    vy = by - ay
-    denom = vx * vx + vy * vy
-    if denom < 1e-12:
-        return p
-    t = ((px - ax) * vx + (py - ay) * vy) / denom
-    projx = ax + t * vx
-    projy = ay + t * vy
-    return (2.0 * projx - px, 2.0 * projy - py)
 
-
-def _line_segment_intersection(
-    a0: Point2D, a1: Point2D, b0: Point2D, b1: Point2D
-) -> Point2D | None:
-    ax, ay = a0
-    bx, by = a1
-    cx, cy = b0
-    dx, dy = b1
+@_njit(cache=True, fastmath=True, boundscheck=False, error_model="numpy")
+def _segseg(
+    ax: float, ay: float, bx: float, by: float,
+    cx: float, cy: float, dx: float, dy: float,
+) -> Tuple[float, float, bool]:
+    """线段求交标量核：返回 (x, y, hit)，纯浮点便于 njit。"""
     r_x = bx - ax
     r_y = by - ay
     s_x = dx - cx
     s_y = dy - cy
     denom = r_x * s_y - r_y * s_x
     if abs(denom) < 1e-12:
-        return None
+        return 0.0, 0.0, False
     t = ((cx - ax) * s_y - (cy - ay) * s_x) / denom
     u = ((cx - ax) * r_y - (cy - ay) * r_x) / denom
     if 0.0 <= t <= 1.0 and 0.0 <= u <= 1.0:
-        return (ax + t * r_x, ay + t * r_y)
-    return None
+        return ax + t * r_x, ay + t * r_y, True
+    return 0.0, 0.0, False
+
+
+def _line_segment_intersection(
+    a0: Point2D, a1: Point2D, b0: Point2D, b1: Point2D
+) -> Point2D | None:
+    x, y, hit = _segseg(
+        float(a0[0]), float(a0[1]), float(a1[0]), float(a1[1]),
+        float(b0[0]), float(b0[1]), float(b1[0]), float(b1[1]),
+    )
+    return (x, y) if hit else None
 
 
-def _build_unfold_polygons(
+@functools.lru_cache(maxsize=32)
+def _spiral_constants(b: float, dtheta_deg: int, p: float) -> Tuple[float, float, float, float]:
+    """派生常数 (dtheta, eb, c_factor, gamma)；只在 b/Δθ/p 变化时重算。"""
+    dtheta = math.radians(max(1, int(dtheta_deg)))
+    eb = math.exp(2.0 * math.pi * b)
+    c_factor = (1.0 - p) + p * eb
+    gamma = math.exp(b * dtheta)
+    return dtheta, eb, c_factor, gamma
+
+
+@functools.lru_cache(maxsize=16)
+def _l_vtip(a: float, b: float, p: float) -> float:
+    """虚拟尖端弧长；只依赖 (a, b, p)，拖其它滑条时免去 exp/sqrt。"""
+    c_factor = (1.0 - p) + p * math.exp(2.0 * math.pi * b)
+    return (c_factor * a * math.sqrt(b * b + 1.0)) / b
+
+
+def _build_geometry(
     a: float,
     b: float,
     dtheta_deg: int,
-    p: float,
     turns: float,
-    unit_count: int,
-) -> Tuple[List[List[Point2D]], List[List[Point2D]]]:
-    dtheta = math.radians(max(1, int(dtheta_deg)))
-    gamma = math.exp(b * dtheta)
+    p: float,
+) -> Tuple[
+    np.ndarray,
+    np.ndarray,
+    np.ndarray,
+    List[Tuple[List[float], List[float]]],
+    np.ndarray,
+    np.ndarray,
+]:
+    """一次构建极坐标单元与展开多边形，共享采样与派生常数。"""
+    dtheta, eb, c_factor, gamma = _spiral_constants(b, dtheta_deg, p)
+    theta_end = 2.0 * math.pi * turns
+    rc_end = max(0.0, theta_end - 2.0 * math.pi)
 
-    eb = math.exp(2.0 * math.pi * b)
-    c_factor = (1.0 - p) + p * eb
+    # Polar samples of both spirals
+    theta_vals = np.arange(0.0, theta_end + 1e-12, dtheta)
+    r_vals = a * np.exp(b * theta_vals)
+    rc_vals = c_factor * r_vals
+
+    unit_count = max(0, int(np.searchsorted(theta_vals, rc_end + 1e-12, side="right")) - 1)
+    units_primary: List[Tuple[List[float], List[float]]] = []
+    for i in range(unit_count):
+        t0 = theta_vals[i]
+        t1 = theta_vals[i + 1]
+        units_primary.append(
+            ([t0, t1, t1, t0], [r_vals[i], r_vals[i + 1], rc_vals[i + 1], rc_vals[i]])
+        )
 
+    # Unfolded trapezoids, placed along the x axis
     r0 = a
     r1 = a * math.exp(b * dtheta)
     rc0 = c_factor * r0
     rc1 = c_factor * r1
 
-    p0 = _polar_to_cart(0.0, r0)
-    p1 = _polar_to_cart(dtheta, r1)
-    q0 = _polar_to_cart(0.0, rc0)
-    q1 = _polar_to_cart(dtheta, rc1)
+    cd = math.cos(dtheta)
+    sd = math.sin(dtheta)
+    p0 = (r0, 0.0)
+    p1 = (r1 * cd, r1 * sd)
+    q0 = (rc0, 0.0)
+    q1 = (rc1 * cd, rc1 * sd)
 
     dq = (q1[0] - q0[0], q1[1] - q0[1])
     angle = -math.atan2(dq[1], dq[0])
@@ -204,89 +251,68 @@ def _build_unfold_polygons(
         x, y = pt
         return (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
 
-    base = [rot(p0), rot(p1), rot(q1), rot(q0)]
+    base = np.array([rot(p0), rot(p1), rot(q1), rot(q0)])
 
     unit_count = max(1, unit_count)
-    primary_polys: List[List[Point2D]] = []
-    mirror_polys: List[List[Point2D]] = []
+    # SoA 存储：(N, 4, 2) float64，比嵌套 tuple 列表省内存且可直接喂给 set_verts
+    primary_polys = np.empty((unit_count, 4, 2), dtype=np.float64)
+    mirror_polys = np.empty((unit_count, 4, 2), dtype=np.float64)
 
     current_x = 0.0
+    scale = 1.0
     for k in range(unit_count):
-        scale = gamma**k
-        scaled = [(x * scale, y * scale) for x, y in base]
-        q0_scaled = scaled[3]
-        q1_scaled = scaled[2]
-        dx = current_x - q0_scaled[0]
-        dy = -q0_scaled[1]
-        placed = [(x + dx, y + dy) for x, y in scaled]
-        placed_mirror = [(x, -y) for x, y in placed]
-        primary_polys.append(placed)
-        mirror_polys.append(placed_mirror)
-        current_x = dx + q1_scaled[0]
-
-    return primary_polys, mirror_polys
-
-
-def _build_polar_units(
+        scaled = base * scale
+        dx = current_x - scaled[3, 0]
+        dy = -scaled[3, 1]
+        placed = scaled + (dx, dy)
+        primary_polys[k] = placed
+        mirror_polys[k] = placed * (1.0, -1.0)
+        current_x = dx + scaled[2, 0]
+        # 递增累乘代替每圈 gamma**k 的 pow 调用
+        scale *= gamma
+
+    return theta_vals, r_vals, rc_vals, units_primary, primary_polys, mirror_polys
+
+
+@functools.lru_cache(maxsize=128)
+def _compute_geometry(
     a: float,
     b: float,
     dtheta_deg: int,
-    turns: float,
+    theta_max_pi: float,
     p: float,
-) -> Tuple[
-    List[float],
-    List[float],
-    List[float],
-    List[Tuple[List[float], List[float]]],
-    List[Tuple[List[float], List[float]]],
-    int,
-]:
-    theta_end = 2.0 * math.pi * turns
-    rc_end = max(0.0, theta_end - 2.0 * math.pi)
-    dtheta = math.radians(max(1, int(dtheta_deg)))
-
-    theta_vals: List[float] = []
-    r_vals: List[float] = []
-    rc_vals: List[float] = []
-    units_primary: List[Tuple[List[float], List[float]]] = []
-    units_mirror: List[Tuple[List[float], List[float]]] = []
-
-    eb = math.exp(2.0 * math.pi * b)
-    c_factor = (1.0 - p) + p * eb
-
-    theta = 0.0
-    while theta <= theta_end + 1e-12:
-        r = a * math.exp(b * theta)
-        rc = c_factor * r
-        theta_vals.append(theta)
-        r_vals.append(r)
-        rc_vals.append(rc)
-        theta += dtheta
-
-    unit_count = 0
-    for i in range(len(theta_vals) - 1):
-        t0 = theta_vals[i]
-        t1 = theta_vals[i + 1]
-        if t1 > rc_end + 1e-12:
-            break
-        r0 = r_vals[i]
-        r1 = r_vals[i + 1]
-        rc0 = rc_vals[i]
-        rc1 = rc_vals[i + 1]
-        units_primary.append(([t0, t1, t1, t0], [r0, r1, rc1, rc0]))
-        # Mirror trapezoid across the central-spiral edge (q0-q1)
-        p0 = _polar_to_cart(t0, r0)
-        p1 = _polar_to_cart(t1, r1)
-        q0 = _polar_to_cart(t0, rc0)
-        q1 = _polar_to_cart(t1, rc1)
-        p0m = _reflect_point_across_line(p0, q0, q1)
-        p1m = _reflect_point_across_line(p1, q0, q1)
-        t0m, r0m = _cart_to_polar(*p0m)
-        t1m, r1m = _cart_to_polar(*p1m)
-        units_mirror.append(([t0, t1, t1m, t0m], [rc0, rc1, r1m, r0m]))
-        unit_count += 1
-
-    return theta_vals, r_vals, rc_vals, units_primary, units_mirror, unit_count
+):
+    """纯计算部分：滑块拖动时相同参数直接命中缓存，跳过重算。"""
+    turns = max(0.1, theta_max_pi / 2.0)
+    theta_vals, r_vals, rc_vals, units_primary, primary, mirror = _build_geometry(
+        a=a,
+        b=b,
+        dtheta_deg=dtheta_deg,
+        turns=turns,
+        p=p,
+    )
+    if primary.size == 0:
+        return None
+    base_size = 2.0 * float(primary[-1, :, 1].max())
+    tip_size = 2.0 * float(primary[0, :, 1].max())
+    _dtheta, eb, _c_factor, _gamma = _spiral_constants(b, dtheta_deg, p)
+    taper_angle = 2.0 * math.atan(
+        (b * (eb - 1.0)) / (math.sqrt(b * b + 1.0) * (eb + 1.0))
+    )
+    robot_length = float(primary[-1, :, 0].max())
+    return (
+        theta_vals,
+        r_vals,
+        rc_vals,
+        units_primary,
+        turns,
+        primary,
+        mirror,
+        base_size,
+        tip_size,
+        taper_angle,
+        robot_length,
+    )
 
 
 class MainWindow(QMainWindow):
@@ -294,8 +320,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("螺旋机器人设计工具")
         self.params = Params()
-        self._polys_primary: List[List[Point2D]] = []
-        self._polys_mirror: List[List[Point2D]] = []
+        self._polys_primary: np.ndarray = np.empty((0, 4, 2), dtype=np.float64)
+        self._polys_mirror: np.ndarray = np.empty((0, 4, 2), dtype=np.float64)
         self._elastic_poly: List[Point2D] | None = None
         self._elastic_poly_mirror: List[Point2D] | None = None
         self._ray_start: Point2D | None = None
@@ -309,6 +335,18 @@ class MainWindow(QMainWindow):
         self._robot_length = 0.0
         self._last_polar = None
         self._last_cart = None
+        self._last_params_key = None
+        self._cart_xbounds = (0.0, 0.0)
+        self._report_fig = None
+        self._report_axes = None
+        # CadQuery 实体缓存：(参数签名, solid)，参数未变时跳过 OCCT 重建
+        self._frustum_cache: Tuple[Optional[tuple], object] = (None, None)
+        self._frustum_holes_cache: Tuple[Optional[tuple], object] = (None, None)
+        self._cone2_cache: Tuple[Optional[tuple], object] = (None, None)
+        # CadQuery 推迟到首次 CAD 操作再导入（OCP 绑定加载以秒计），
+        # 纯 2D 工作流不为它买单；见 _cq 属性
+        self._cq_module: object = None
+        self._cq_resolved = False
 
         root = QWidget()
         self.setCentralWidget(root)
@@ -337,6 +375,8 @@ class MainWindow(QMainWindow):
         self.cart_ax = self.cart_fig.add_subplot(111)
         left_split.addWidget(self.cart_canvas)
 
+        self._init_plot_artists()
+
         # Outputs below cartesian plot
         info_panel = QWidget()
         info_panel.setStyleSheet("background-color: #ffffff;")
@@ -632,7 +672,7 @@ class MainWindow(QMainWindow):
         self.export_xml_btn.clicked.connect(self.export_xml)
         self.cable_toggle.toggled.connect(self._on_cable_toggle)
         self._on_cable_toggle(self.cable_toggle.isChecked())
-        for w in (
+        self._param_widgets = (
             self.a_spin,
             self.b_spin,
             self.dtheta_spin,
@@ -659,7 +699,8 @@ class MainWindow(QMainWindow):
             self.tip_hole_size_slider,
             self.base_hole_pos_slider,
             self.base_hole_size_slider,
-        ):
+        )
+        for w in self._param_widgets:
             w.valueChanged.connect(self.schedule_update)
         self.elastic_check.toggled.connect(lambda _v: self.schedule_update())
 
@@ -681,8 +722,6 @@ class MainWindow(QMainWindow):
         if self._resizing:
             return
         self._update_timer.start(120)
-        self._update_cone1_range()
-        self._update_cone2_range()
 
     def _on_cable_toggle(self, checked: bool) -> None:
         self.params.two_cable = bool(checked)
@@ -699,6 +738,9 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
+        # 尺寸一变旧背景即失效，禁止用陈旧位图继续 blit
+        self._polar_bg = None
+        self._cart_bg = None
         self._resizing = True
         self.polar_canvas.setUpdatesEnabled(False)
         self.cart_canvas.setUpdatesEnabled(False)
@@ -737,8 +779,19 @@ class MainWindow(QMainWindow):
         slider.setSingleStep(max(1, int(step * scale)))
         slider.setValue(int(value * scale))
 
-        box.valueChanged.connect(lambda v: slider.setValue(int(v * scale)))
-        slider.valueChanged.connect(lambda v: box.setValue(v / scale))
+        # 单向静默同步，避免 spin↔slider 互相回弹导致的双重更新
+        def _sync_slider(v: float) -> None:
+            slider.blockSignals(True)
+            slider.setValue(int(v * scale))
+            slider.blockSignals(False)
+
+        def _sync_box(v: int) -> None:
+            box.blockSignals(True)
+            box.setValue(v / scale)
+            box.blockSignals(False)
+
+        box.valueChanged.connect(_sync_slider)
+        slider.valueChanged.connect(_sync_box)
 
         label_text = label if not unit else f"{label} {unit}"
         label_widget = QLabel(label_text)
@@ -773,8 +826,19 @@ class MainWindow(QMainWindow):
         slider.setSingleStep(1)
         slider.setValue(value)
 
-        box.valueChanged.connect(slider.setValue)
-        slider.valueChanged.connect(box.setValue)
+        # 单向静默同步，避免 spin↔slider 互相回弹导致的双重更新
+        def _sync_slider(v: int) -> None:
+            slider.blockSignals(True)
+            slider.setValue(v)
+            slider.blockSignals(False)
+
+        def _sync_box(v: int) -> None:
+            box.blockSignals(True)
+            box.setValue(v)
+            box.blockSignals(False)
+
+        box.valueChanged.connect(_sync_slider)
+        slider.valueChanged.connect(_sync_box)
 
         label_text = label if not unit else f"{label} {unit}"
         label_widget = QLabel(label_text)
@@ -797,13 +861,22 @@ class MainWindow(QMainWindow):
         if hasattr(self, "_extrusion_initialized"):
             delattr(self, "_extrusion_initialized")
         defaults = Params()
+        # 批量静默重置：每个 setValue 都会触发一次防抖更新，统一屏蔽后只刷新一次
+        for w in self._param_widgets:
+            w.blockSignals(True)
+        # 信号被屏蔽时 spin→slider 同步不会触发，滑条需要在此显式归位
         self.a_spin.setValue(defaults.a)
+        self.a_slider.setValue(int(defaults.a * 1000))
         self.b_spin.setValue(defaults.b)
+        self.b_slider.setValue(int(defaults.b * 10000))
         self.dtheta_spin.setValue(defaults.dtheta_deg)
+        self.dtheta_slider.setValue(defaults.dtheta_deg)
         self.theta_max_spin.setValue(defaults.theta_max_pi)
         self.theta_max_slider.setValue(int(defaults.theta_max_pi * 10))
         self.p_spin.setValue(defaults.p)
+        self.p_slider.setValue(int(defaults.p * 100))
         self.elastic_spin.setValue(defaults.elastic_percent)
+        self.elastic_slider.setValue(int(defaults.elastic_percent * 10))
         self.elastic_check.setChecked(defaults.elastic_enabled)
         self.cable_toggle.setChecked(defaults.two_cable)
         self.cone1_spin.setValue(defaults.cone_angle1)
@@ -811,21 +884,37 @@ class MainWindow(QMainWindow):
         self.cone2_spin.setValue(defaults.cone_angle2)
         self.cone2_slider.setValue(int(defaults.cone_angle2 * 10))
         self.tip_hole_pos_spin.setValue(defaults.tip_hole_pos)
+        self.tip_hole_pos_slider.setValue(int(defaults.tip_hole_pos))
         self.tip_hole_size_spin.setValue(defaults.tip_hole_size)
+        self.tip_hole_size_slider.setValue(int(defaults.tip_hole_size * 10))
         self.base_hole_pos_spin.setValue(defaults.base_hole_pos)
+        self.base_hole_pos_slider.setValue(int(defaults.base_hole_pos))
         self.base_hole_size_spin.setValue(defaults.base_hole_size)
+        self.base_hole_size_slider.setValue(int(defaults.base_hole_size * 10))
         self.sim_stiffness_spin.setValue(defaults.sim_stiffness)
         self.sim_stiffness_slider.setValue(int(defaults.sim_stiffness * 1000))
         self.sim_damping_spin.setValue(defaults.sim_damping)
         self.sim_damping_slider.setValue(int(defaults.sim_damping * 1000))
+        for w in self._param_widgets:
+            w.blockSignals(False)
         self._on_cable_toggle(self.cable_toggle.isChecked())
+        self._last_params_key = None
         self.update_2d()
         # re-apply cone1 defaults after update_2d range init
+        for w in (self.cone1_spin, self.cone1_slider):
+            w.blockSignals(True)
         self.cone1_spin.setValue(defaults.cone_angle1)
         self.cone1_slider.setValue(int(defaults.cone_angle1 * 10))
-        self.update_2d()
+        for w in (self.cone1_spin, self.cone1_slider):
+            w.blockSignals(False)
         self.update_scene() # type: ignore
 
+    @property
+    def _polys_all(self):
+        """主/镜像/弹性多边形的零拷贝遍历视图。"""
+        extras = [p for p in (self._elastic_poly, self._elastic_poly_mirror) if p]
+        return itertools.chain(self._polys_primary, self._polys_mirror, extras)
+
     def update_2d(self) -> None:
         self.params.a = float(self.a_spin.value())
         self.params.b = float(self.b_spin.value())
@@ -838,67 +927,74 @@ class MainWindow(QMainWindow):
         self.params.tip_hole_size = float(self.tip_hole_size_spin.value())
         self.params.base_hole_pos = float(self.base_hole_pos_spin.value()) / 100.0
         self.params.base_hole_size = float(self.base_hole_size_spin.value())
-
-        turns = max(0.1, self.params.theta_max_pi / 2.0)
-        theta_vals, r_vals, rc_vals, units_primary, units_mirror, unit_count = _build_polar_units(
-            a=self.params.a,
-            b=self.params.b,
-            dtheta_deg=self.params.dtheta_deg,
-            turns=turns,
-            p=self.params.p,
+        self.params.extrusion = float(self.extrusion_spin.value())
+        self.params.extrusion_clamped = max(0.1, self.params.extrusion)
+
+        # 程序化 setValue（重置、slider↔spin 同步）会触发值未变的信号，直接跳过
+        key = (
+            self.params.a,
+            self.params.b,
+            self.params.dtheta_deg,
+            self.params.theta_max_pi,
+            self.params.p,
+            self.params.elastic_percent,
+            self.params.elastic_enabled,
+            self.params.tip_hole_pos,
+            self.params.tip_hole_size,
+            self.params.base_hole_pos,
+            self.params.base_hole_size,
+            self.params.extrusion,
         )
-        primary, mirror = _build_unfold_polygons(
-            a=self.params.a,
-            b=self.params.b,
-            dtheta_deg=self.params.dtheta_deg,
-            p=self.params.p,
-            turns=turns,
-            unit_count=unit_count,
+        if key == self._last_params_key:
+            return
+        self._last_params_key = key
+
+        geom = _compute_geometry(
+            self.params.a,
+            self.params.b,
+            self.params.dtheta_deg,
+            self.params.theta_max_pi,
+            self.params.p,
         )
-        if not primary:
+        if geom is None:
             return
-        base_size = 2.0 * max(y for _x, y in primary[-1])
+        (
+            theta_vals,
+            r_vals,
+            rc_vals,
+            units_primary,
+            turns,
+            primary,
+            mirror,
+            base_size,
+            tip_size,
+            taper_angle,
+            robot_length,
+        ) = geom
         thickness = max(0.1, base_size * 0.6)
-        tip_size = 2.0 * max(y for _x, y in primary[0])
-        theta_end = max(0.0, math.pi * self.params.theta_max_pi)
-        eb = math.exp(2.0 * math.pi * self.params.b)
-        taper_angle = 2.0 * math.atan(
-            (self.params.b * (eb - 1.0))
-            / (math.sqrt(self.params.b * self.params.b + 1.0) * (eb + 1.0))
-        )
         self._taper_angle_deg = math.degrees(taper_angle)
-        self._robot_length = max(x for x, _y in primary[-1])
+        self._robot_length = robot_length
         self._base_size = base_size
         self._tip_size = tip_size
 
-        min_extrusion = max(0.0, self._base_size * 0.2)
-        max_extrusion = max(min_extrusion, self._base_size)
-        default_extrusion = max(0.0, self._base_size * 0.6)
-        self.extrusion_spin.blockSignals(True)
-        self.extrusion_slider.blockSignals(True)
-        self.extrusion_spin.setRange(min_extrusion, max_extrusion)
-        self.extrusion_slider.setRange(int(min_extrusion * 10), int(max_extrusion * 10))
-        current_extrusion = default_extrusion
-        if current_extrusion < min_extrusion or current_extrusion > max_extrusion:
-            current_extrusion = max(min_extrusion, min(max_extrusion, current_extrusion))
-        self.extrusion_spin.setValue(current_extrusion)
-        self.extrusion_slider.setValue(int(current_extrusion * 10))
-        self._extrusion_initialized = True
-        self.extrusion_spin.blockSignals(False)
-        self.extrusion_slider.blockSignals(False)
-        self.params.extrusion = float(self.extrusion_spin.value())
+        # 一次性屏蔽重绘：范围/数值/标签的批量写只触发结尾的一次刷新
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_widget_state(thickness, tip_size, base_size, len(primary))
+        finally:
+            self.setUpdatesEnabled(True)
 
         elastic_poly = None
         elastic_poly_mirror = None
         # Rays are based on taper angle and virtual tip
-        eb = math.exp(2.0 * math.pi * self.params.b)
-        c_factor = (1.0 - self.params.p) + self.params.p * eb
-        l_vtip = (c_factor * self.params.a * math.sqrt(self.params.b**2 + 1.0)) / self.params.b
+        l_vtip = _l_vtip(self.params.a, self.params.b, self.params.p)
         elastic_angle = (self.params.elastic_percent / 100.0) * (taper_angle * 0.5)
         m = math.tan(elastic_angle) if elastic_angle != 0 else 0.0
-        left_edge = (primary[0][0], primary[0][3])
-        right_edge = (primary[-1][1], primary[-1][2])
-        max_poly_x = max(x for poly in primary for x, _y in poly)
+        left_edge = (primary[0, 0], primary[0, 3])
+        right_edge = (primary[-1, 1], primary[-1, 2])
+        xs = primary[..., 0]
+        self._cart_xbounds = (float(xs.min()), float(xs.max()))
+        max_poly_x = self._cart_xbounds[1]
         ray_len = max(10.0, max_poly_x + l_vtip + 10.0)
         ray_start = (-l_vtip, 0.0)
         ray_upper_end = (-l_vtip + ray_len, m * ray_len)
@@ -907,7 +1003,8 @@ class MainWindow(QMainWindow):
         self._ray_upper_end = ray_upper_end
         self._ray_lower_end = ray_lower_end
 
-        if self.params.elastic_enabled:
+        # elastic_angle≈0 时射线贴着 x 轴，弹性层退化为空，免去两次求交
+        if self.params.elastic_enabled and elastic_angle > 1e-12:
             upper_left = _line_segment_intersection(
                 ray_start, ray_upper_end, left_edge[0], left_edge[1]
             )
@@ -920,18 +1017,37 @@ class MainWindow(QMainWindow):
                 elastic_poly = [q0_left, upper_left, upper_right, q1_right]
                 elastic_poly_mirror = [(x, -y) for x, y in elastic_poly]
 
-        polys_all = primary + mirror
-        if elastic_poly:
-            polys_all.append(elastic_poly)
-        if elastic_poly_mirror:
-            polys_all.append(elastic_poly_mirror)
-
         self._polys_primary = primary
         self._polys_mirror = mirror
         self._elastic_poly = elastic_poly
         self._elastic_poly_mirror = elastic_poly_mirror
-        self._polys_all = polys_all
         self._thickness = thickness
+
+        self._last_polar = (theta_vals, r_vals, rc_vals, units_primary, turns)
+        self._last_cart = (primary, mirror, elastic_poly, elastic_poly_mirror)
+
+        self._draw_polar(theta_vals, r_vals, rc_vals, units_primary, turns)
+        self._draw_cartesian(primary, mirror, elastic_poly, elastic_poly_mirror)
+
+    def _apply_widget_state(self, thickness: float, tip_size: float, base_size: float, unit_count: int) -> None:
+        """集中完成 update_2d 中的全部控件写操作。"""
+        min_extrusion = max(0.0, self._base_size * 0.2)
+        max_extrusion = max(min_extrusion, self._base_size)
+        default_extrusion = max(0.0, self._base_size * 0.6)
+        self.extrusion_spin.blockSignals(True)
+        self.extrusion_slider.blockSignals(True)
+        self.extrusion_spin.setRange(min_extrusion, max_extrusion)
+        self.extrusion_slider.setRange(int(min_extrusion * 10), int(max_extrusion * 10))
+        current_extrusion = default_extrusion
+        if current_extrusion < min_extrusion or current_extrusion > max_extrusion:
+            current_extrusion = max(min_extrusion, min(max_extrusion, current_extrusion))
+        self.extrusion_spin.setValue(current_extrusion)
+        self.extrusion_slider.setValue(int(current_extrusion * 10))
+        self._extrusion_initialized = True
+        self.extrusion_spin.blockSignals(False)
+        self.extrusion_slider.blockSignals(False)
+        self.params.extrusion = float(self.extrusion_spin.value())
+        self.params.extrusion_clamped = max(0.1, self.params.extrusion)
         if not hasattr(self, "_extrusion_initialized"):
             self.params.extrusion = thickness
             self.extrusion_spin.setValue(thickness)
@@ -942,28 +1058,36 @@ class MainWindow(QMainWindow):
         self.tip_label.setText(f"尖端尺寸: {tip_size:.2f} mm")
         self.base_label.setText(f"基座尺寸: {base_size:.2f} mm")
         self.length_label.setText(f"机器人长度: {self._robot_length:.2f} mm")
-        self.units_label.setText(f"单元数: {len(primary)}")
+        self.units_label.setText(f"单元数: {unit_count}")
 
         self._update_cone1_range()
         self._update_cone2_range()
 
-        self._last_polar = (theta_vals, r_vals, rc_vals, units_primary, units_mirror, turns)
-        self._last_cart = (primary, mirror, elastic_poly, elastic_poly_mirror)
-
-        self._draw_polar(theta_vals, r_vals, rc_vals, units_primary, units_mirror, turns)
-        self._draw_cartesian(primary, mirror, elastic_poly, elastic_poly_mirror)
+    @property
+    def _cq(self):
+        """首次访问时导入并缓存 CadQuery；缺失时缓存 None，各 CAD 方法统一降级返回。"""
+        if not self._cq_resolved:
+            self._cq_resolved = True
+            try:
+                import cadquery
+                self._cq_module = cadquery
+            except Exception:
+                self._cq_module = None
+        return self._cq_module
 
     def _build_frustum_solid(self):
         if self._robot_length <= 1e-6:
             return None
-        try:
-            import cadquery as cq
-        except Exception:
+        cq = self._cq
+        if cq is None:
             return None
         tip_pos = (float(self.tip_hole_pos_spin.value()) / 100.0) if hasattr(self, "tip_hole_pos_spin") else self.params.tip_hole_pos
         tip_size = float(self.tip_hole_size_spin.value()) if hasattr(self, "tip_hole_size_spin") else self.params.tip_hole_size
         base_pos = (float(self.base_hole_pos_spin.value()) / 100.0) if hasattr(self, "base_hole_pos_spin") else self.params.base_hole_pos
         base_size = float(self.base_hole_size_spin.value()) if hasattr(self, "base_hole_size_spin") else self.params.base_hole_size
+        key = (self._robot_length, self._tip_size, self._base_size, tip_pos, tip_size, base_pos, base_size)
+        if key == self._frustum_cache[0]:
+            return self._frustum_cache[1]
         y0 = max(0.0, min(1.0, tip_pos)) * (self._tip_size * 0.5)
         y1 = max(0.0, min(1.0, base_pos)) * (self._base_size * 0.5)
         p0 = (0.0, y0, 0.0)
@@ -985,45 +1109,53 @@ class MainWindow(QMainWindow):
         )
 
         # Rotate frustum so its axis aligns with p0->p1, then translate so (length_axis,0,0) maps to p1
-        vx, vy, vz = dx / length_axis, dy / length_axis, dz / length_axis
-        ax, ay, az = 0.0, 0.0, 0.0
-        dot = max(-1.0, min(1.0, vx))
-        angle = math.degrees(math.acos(dot))
-        if abs(angle) > 1e-6:
-            # axis = cross([1,0,0], v) = (0, -vz, vy)
-            ax, ay, az = 0.0, -vz, vy
-            norm = math.sqrt(ax * ax + ay * ay + az * az)
-            if norm > 1e-9:
-                ax, ay, az = ax / norm, ay / norm, az / norm
-                frustum = frustum.rotate((0, 0, 0), (ax, ay, az), angle)
-
-        # compute rotated endpoint for (length_axis,0,0)
-        def rot_vec(vx0, vy0, vz0):
-            if abs(angle) <= 1e-6 or (ax == 0.0 and ay == 0.0 and az == 0.0):
-                return (vx0, vy0, vz0)
-            theta = math.radians(angle)
-            cos_t = math.cos(theta)
-            sin_t = math.sin(theta)
-            kx, ky, kz = ax, ay, az
-            dotp = kx * vx0 + ky * vy0 + kz * vz0
-            rx = vx0 * cos_t + (ky * vz0 - kz * vy0) * sin_t + kx * dotp * (1.0 - cos_t)
-            ry = vy0 * cos_t + (kz * vx0 - kx * vz0) * sin_t + ky * dotp * (1.0 - cos_t)
-            rz = vz0 * cos_t + (kx * vy0 - ky * vx0) * sin_t + kz * dotp * (1.0 - cos_t)
-            return (rx, ry, rz)
-
-        end_rot = rot_vec(length_axis, 0.0, 0.0)
-        tx = p1[0] - end_rot[0]
-        ty = p1[1] - end_rot[1]
-        tz = p1[2] - end_rot[2]
-        frustum = frustum.translate((tx, ty, tz))
+        if abs(dz) < 1e-12:
+            # 平面内情形（p0/p1 的 z 恒为 0）：退化为绕 Z 轴的单次旋转
+            angle = math.degrees(math.atan2(dy, dx))
+            if abs(angle) > 1e-9:
+                frustum = frustum.rotate((0, 0, 0), (0, 0, 1), angle)
+        else:
+            # 通用轴角路径，留作将来真正三维轴线的后备
+            vx, vy, vz = dx / length_axis, dy / length_axis, dz / length_axis
+            # axis = cross([1,0,0], v) = (0, -vz, vy)；|axis| = sinφ、vx = cosφ，免去 acos
+            ay, az = -vz, vy
+            sin_phi = math.sqrt(ay * ay + az * az)
+            if sin_phi > 1e-9:
+                angle = math.degrees(math.atan2(sin_phi, vx))
+                frustum = frustum.rotate((0, 0, 0), (0.0, ay / sin_phi, az / sin_phi), angle)
+
+        # 该旋转把 (1,0,0) 映射为 v，故 (length_axis,0,0) 的像即 (dx,dy,dz)，
+        # 平移量退化为 p1-(dx,dy,dz) = p0，无需逐分量 Rodrigues 展开
+        frustum = frustum.translate(p0)
+        self._frustum_cache = (key, frustum)
         return frustum
 
+    def _frustum_hole_compound(self, angles):
+        """锥台孔及其绕 X 轴的旋转副本；参数未变时直接复用缓存实例。
+        副本彼此不相交，作为切削工具无需流形化，打包成 Compound 即可，
+        省掉逐个 BRep fuse"""
+        cq = self._cq
+        frustum = self._build_frustum_solid()
+        if frustum is None:
+            return None
+        key = (self._frustum_cache[0], angles)
+        if key == self._frustum_holes_cache[0]:
+            return self._frustum_holes_cache[1]
+        insts = [
+            frustum if ang == 0.0 else frustum.rotate((0, 0, 0), (1, 0, 0), ang)
+            for ang in angles
+        ]
+        holes = cq.Workplane("XY").newObject(
+            [cq.Compound.makeCompound([w.val() for w in insts])]
+        )
+        self._frustum_holes_cache = (key, holes)
+        return holes
+
     def _build_cone2_preview_solid(self):
         if not self.params.two_cable:
             return None
-        try:
-            import cadquery as cq
-        except Exception:
+        cq = self._cq
+        if cq is None:
             return None
         if self._robot_length <= 1e-6:
             return None
@@ -1031,7 +1163,10 @@ class MainWindow(QMainWindow):
         cone2 = float(self.cone2_spin.value())
         if abs(cone2) <= 1e-6:
             return None
-        thickness = max(0.1, float(self.extrusion_spin.value()))
+        thickness = self.params.extrusion_clamped
+        key = (self._robot_length, cone1, cone2, thickness, self._base_size)
+        if key == self._cone2_cache[0]:
+            return self._cone2_cache[1]
         base_x = self._robot_length
         # point1: intersection of cone1 plane with +Z axis (x=0,y=0)
         alpha = -math.radians(cone1 * 0.5)
@@ -1067,6 +1202,7 @@ class MainWindow(QMainWindow):
         pair_xy = rect.union(rect_xy)
         rect_xz = pair_xy.mirror(mirrorPlane="XZ")
         pair_xz = pair_xy.union(rect_xz)
+        self._cone2_cache = (key, pair_xz)
         return pair_xz
 
     def _update_cone2_range(self) -> None:
@@ -1091,34 +1227,115 @@ class MainWindow(QMainWindow):
         if current > max_angle_deg:
             self.cone1_spin.setValue(max_angle_deg)
 
+    def _init_plot_artists(self) -> None:
+        # 持久化 artist：更新时只替换顶点/数据，避免 clear 后整轴重建
+        self.polar_ax.set_title("螺旋触手设计")
+        self.polar_ax.grid(True, alpha=0.3)
+        (self._polar_r_line,) = self.polar_ax.plot([], [], color="#1f77b4", linewidth=2.0)
+        (self._polar_rc_line,) = self.polar_ax.plot([], [], color="#ff7f0e", linewidth=2.0)
+        self._polar_units_coll = PolyCollection(
+            [], facecolors="#9ecae1", edgecolors="#6baed6", alpha=0.35, linewidths=0.6
+        )
+        self.polar_ax.add_collection(self._polar_units_coll)
+
+        self.cart_ax.set_title("Unfolded (Cartesian)")
+        self.cart_ax.set_xlabel("x (mm)")
+        self.cart_ax.set_ylabel("y (mm)")
+        self.cart_ax.grid(True, alpha=0.2)
+        self.cart_ax.set_aspect("equal", adjustable="box")
+        self._cart_primary_coll = PolyCollection(
+            [], facecolors="#9ecae1", edgecolors="#6baed6", alpha=0.35, linewidths=0.6
+        )
+        self._cart_mirror_coll = PolyCollection(
+            [], facecolors="#a1d99b", edgecolors="#74c476", alpha=0.35, linewidths=0.6
+        )
+        self._cart_elastic_coll = PolyCollection(
+            [], facecolors="#ff7f0e", edgecolors="#ff7f0e", alpha=0.28, linewidths=0.9
+        )
+        for coll in (
+            self._cart_primary_coll,
+            self._cart_mirror_coll,
+            self._cart_elastic_coll,
+        ):
+            self.cart_ax.add_collection(coll)
+        (self._ray_upper_line,) = self.cart_ax.plot([], [], color="#9aa0a6", linewidth=0.6)
+        (self._ray_lower_line,) = self.cart_ax.plot([], [], color="#9aa0a6", linewidth=0.6)
+
+        # 动态 artist 标记为 animated，配合 blit 只重绘脏区域
+        self._polar_dynamic = (
+            self._polar_r_line,
+            self._polar_rc_line,
+            self._polar_units_coll,
+        )
+        self._cart_dynamic = (
+            self._cart_primary_coll,
+            self._cart_mirror_coll,
+            self._cart_elastic_coll,
+            self._ray_upper_line,
+            self._ray_lower_line,
+        )
+        for artist in self._polar_dynamic + self._cart_dynamic:
+            artist.set_animated(True)
+        self._polar_bg = None
+        self._cart_bg = None
+        self.polar_canvas.mpl_connect("draw_event", self._on_polar_draw)
+        self.cart_canvas.mpl_connect("draw_event", self._on_cart_draw)
+
+    def _on_polar_draw(self, _event) -> None:
+        # savefig 的绘制已包含动画 artist，再画会叠加半透明填充并污染背景缓存
+        if self.polar_canvas.is_saving():
+            return
+        # 完整重绘后缓存静态背景（轴框、网格、刻度），供 blit 复用
+        self._polar_bg = self.polar_canvas.copy_from_bbox(self.polar_ax.bbox)
+        for artist in self._polar_dynamic:
+            self.polar_ax.draw_artist(artist)
+
+    def _on_cart_draw(self, _event) -> None:
+        if self.cart_canvas.is_saving():
+            return
+        self._cart_bg = self.cart_canvas.copy_from_bbox(self.cart_ax.bbox)
+        for artist in self._cart_dynamic:
+            self.cart_ax.draw_artist(artist)
+
+    def _blit_axes(self, canvas, ax, background, artists) -> None:
+        canvas.restore_region(background)
+        for artist in artists:
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+
     def _draw_polar(
         self,
-        theta_vals: List[float],
-        r_vals: List[float],
-        rc_vals: List[float],
+        theta_vals: np.ndarray,
+        r_vals: np.ndarray,
+        rc_vals: np.ndarray,
         units_primary: List[Tuple[List[float], List[float]]],
-        units_mirror: List[Tuple[List[float], List[float]]],
         turns: float,
     ) -> None:
-        self._draw_polar_on(
-            self.polar_ax,
-            theta_vals,
-            r_vals,
-            rc_vals,
-            units_primary,
-            units_mirror,
-            turns,
+        self._polar_r_line.set_data(theta_vals, r_vals)
+        rc_end = max(0.0, 2.0 * math.pi * turns - 2.0 * math.pi)
+        mask = theta_vals <= rc_end + 1e-12
+        self._polar_rc_line.set_data(theta_vals[mask], rc_vals[mask])
+        self._polar_units_coll.set_verts(
+            [list(zip(theta_poly, r_poly)) for theta_poly, r_poly in units_primary]
         )
-        self.polar_canvas.draw_idle()
+        r_max = float(rc_vals[-1]) if len(rc_vals) else 1.0
+        ylim = (0.0, r_max * 1.05)
+        if self._polar_bg is not None and ylim == self.polar_ax.get_ylim():
+            # 轴范围没变：背景可复用，只 blit 动态 artist
+            self._blit_axes(
+                self.polar_canvas, self.polar_ax, self._polar_bg, self._polar_dynamic
+            )
+        else:
+            self.polar_ax.set_ylim(*ylim)
+            self.polar_canvas.draw_idle()
 
     def _draw_polar_on(
         self,
         ax,
-        theta_vals: List[float],
-        r_vals: List[float],
-        rc_vals: List[float],
+        theta_vals: np.ndarray,
+        r_vals: np.ndarray,
+        rc_vals: np.ndarray,
         units_primary: List[Tuple[List[float], List[float]]],
-        units_mirror: List[Tuple[List[float], List[float]]],
         turns: float,
     ) -> None:
         ax.clear()
@@ -1126,9 +1343,8 @@ class MainWindow(QMainWindow):
 
         ax.plot(theta_vals, r_vals, color="#1f77b4", linewidth=2.0)
         rc_end = max(0.0, 2.0 * math.pi * turns - 2.0 * math.pi)
-        rc_theta = [t for t in theta_vals if t <= rc_end + 1e-12]
-        rc_r = rc_vals[: len(rc_theta)]
-        ax.plot(rc_theta, rc_r, color="#ff7f0e", linewidth=2.0)
+        mask = theta_vals <= rc_end + 1e-12
+        ax.plot(theta_vals[mask], rc_vals[mask], color="#ff7f0e", linewidth=2.0)
         for theta_poly, r_poly in units_primary:
             ax.fill(
                 theta_poly,
@@ -1138,74 +1354,103 @@ class MainWindow(QMainWindow):
                 edgecolor="#6baed6",
                 linewidth=0.6,
             )
-        for theta_poly, r_poly in units_mirror:
-            ax.fill(
-                theta_poly,
-                r_poly,
-                color="#a1d99b",
-                alpha=0.35,
-                edgecolor="#74c476",
-                linewidth=0.6,
-            )
         ax.grid(True, alpha=0.3)
 
     def _draw_cartesian(
         self,
-        primary: List[List[Point2D]],
-        mirror: List[List[Point2D]],
+        primary: np.ndarray,
+        mirror: np.ndarray,
         elastic_poly: List[Point2D] | None,
         elastic_poly_mirror: List[Point2D] | None,
     ) -> None:
-        self._draw_cartesian_on(
-            self.cart_ax,
-            primary,
-            mirror,
-            elastic_poly,
-            elastic_poly_mirror,
-            self.params.elastic_enabled,
+        self._cart_primary_coll.set_verts(primary)
+        self._cart_mirror_coll.set_verts(mirror)
+        self._cart_elastic_coll.set_verts(
+            [poly for poly in (elastic_poly, elastic_poly_mirror) if poly]
         )
-        self.cart_canvas.draw_idle()
+        draw_rays = (
+            self.params.elastic_enabled
+            and self._ray_start
+            and self._ray_upper_end
+            and self._ray_lower_end
+        )
+        if draw_rays:
+            end_u, end_l = _clip_rays(
+                self._ray_start, [self._ray_upper_end, self._ray_lower_end], self._robot_length
+            )
+            self._ray_upper_line.set_data(
+                [self._ray_start[0], end_u[0]], [self._ray_start[1], end_u[1]]
+            )
+            self._ray_lower_line.set_data(
+                [self._ray_start[0], end_l[0]], [self._ray_start[1], end_l[1]]
+            )
+        else:
+            self._ray_upper_line.set_data([], [])
+            self._ray_lower_line.set_data([], [])
+        if len(primary) == 0:
+            self.cart_canvas.draw_idle()
+            return
+        min_x, max_x = self._cart_xbounds
+        if self._ray_start and self._ray_upper_end and self._ray_lower_end:
+            min_x = min(min_x, self._ray_start[0])
+            max_x = max(max_x, self._ray_upper_end[0], self._ray_lower_end[0])
+        pad_x = 0.05 * (max_x - min_x + 1e-6)
+        xlim = (min_x - pad_x, max_x + pad_x)
+        y_limit = max(self._base_size * 0.75, 1e-6)
+        ylim = (-y_limit, y_limit)
+        if (
+            self._cart_bg is not None
+            and xlim == self.cart_ax.get_xlim()
+            and ylim == self.cart_ax.get_ylim()
+        ):
+            self._blit_axes(
+                self.cart_canvas, self.cart_ax, self._cart_bg, self._cart_dynamic
+            )
+        else:
+            self.cart_ax.set_xlim(*xlim)
+            self.cart_ax.set_ylim(*ylim)
+            self.cart_canvas.draw_idle()
 
     def _draw_cartesian_on(
         self,
         ax,
-        primary: List[List[Point2D]],
-        mirror: List[List[Point2D]],
+        primary: np.ndarray,
+        mirror: np.ndarray,
         elastic_poly: List[Point2D] | None,
         elastic_poly_mirror: List[Point2D] | None,
         draw_rays: bool,
     ) -> None:
         ax.clear()
         ax.set_title("Unfolded (Cartesian)")
-        for poly in primary:
-            xs = [p[0] for p in poly]
-            ys = [p[1] for p in poly]
-            ax.fill(xs, ys, color="#9ecae1", alpha=0.35, edgecolor="#6baed6", linewidth=0.6)
-        for poly in mirror:
-            xs = [p[0] for p in poly]
-            ys = [p[1] for p in poly]
-            ax.fill(xs, ys, color="#a1d99b", alpha=0.35, edgecolor="#74c476", linewidth=0.6)
-        if elastic_poly:
-            xs = [p[0] for p in elastic_poly]
-            ys = [p[1] for p in elastic_poly]
-            ax.fill(xs, ys, color="#ff7f0e", alpha=0.28, edgecolor="#ff7f0e", linewidth=0.9)
-        if elastic_poly_mirror:
-            xs = [p[0] for p in elastic_poly_mirror]
-            ys = [p[1] for p in elastic_poly_mirror]
-            ax.fill(xs, ys, color="#ff7f0e", alpha=0.28, edgecolor="#ff7f0e", linewidth=0.9)
-        if draw_rays and self._ray_start and self._ray_upper_end and self._ray_lower_end:
-            def _clip_ray(start: Point2D, end: Point2D, x_max: float) -> Point2D:
-                sx, sy = start
-                ex, ey = end
-                if ex <= x_max:
-                    return end
-                if abs(ex - sx) < 1e-9:
-                    return (x_max, sy)
-                t = (x_max - sx) / (ex - sx)
-                return (sx + t * (ex - sx), sy + t * (ey - sy))
-
-            end_u = _clip_ray(self._ray_start, self._ray_upper_end, self._robot_length)
-            end_l = _clip_ray(self._ray_start, self._ray_lower_end, self._robot_length)
+        # 每色一个 PolyCollection，单次 C 级批绘替代逐四边形 ax.fill
+        if len(primary):
+            ax.add_collection(
+                PolyCollection(
+                    primary, facecolors="#9ecae1", edgecolors="#6baed6", alpha=0.35, linewidths=0.6
+                )
+            )
+        if len(mirror):
+            ax.add_collection(
+                PolyCollection(
+                    mirror, facecolors="#a1d99b", edgecolors="#74c476", alpha=0.35, linewidths=0.6
+                )
+            )
+        elastic_verts = [p for p in (elastic_poly, elastic_poly_mirror) if p]
+        if elastic_verts:
+            ax.add_collection(
+                PolyCollection(
+                    elastic_verts, facecolors="#ff7f0e", edgecolors="#ff7f0e", alpha=0.28, linewidths=0.9
+                )
+            )
+        if (
+            draw_rays
+            and self._ray_start
+            and self._ray_upper_end
+            and self._ray_lower_end
+        ):
+            end_u, end_l = _clip_rays(
+                self._ray_start, [self._ray_upper_end, self._ray_lower_end], self._robot_length
+            )
             ax.plot(
                 [self._ray_start[0], end_u[0]],
                 [self._ray_start[1], end_u[1]],
@@ -1219,9 +1464,8 @@ class MainWindow(QMainWindow):
                 linewidth=0.6,
             )
         ax.set_aspect("equal", adjustable="box")
-        if primary:
-            min_x = min(min(x for x, _y in poly) for poly in primary)
-            max_x = max(max(x for x, _y in poly) for poly in primary)
+        if len(primary):
+            min_x, max_x = self._cart_xbounds
             if self._ray_start and self._ray_upper_end and self._ray_lower_end:
                 min_x = min(min_x, self._ray_start[0])
                 max_x = max(max_x, self._ray_upper_end[0], self._ray_lower_end[0])
@@ -1234,6 +1478,11 @@ class MainWindow(QMainWindow):
         ax.grid(True, alpha=0.2)
 
     def save_image(self) -> None:
+        # 导出专用依赖延迟加载，避免拖慢应用启动
+        import matplotlib.image as mpimg
+        from PySide6.QtCore import QMarginsF
+        from PySide6.QtPrintSupport import QPrinter
+
         out_dir = os.path.join(os.path.dirname(__file__), "exports")
         os.makedirs(out_dir, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1244,6 +1493,7 @@ class MainWindow(QMainWindow):
         self.polar_fig.savefig(polar_path, dpi=200)
         self.cart_fig.savefig(cart_path, dpi=200)
         # Prefer VTK capture to avoid black OpenGL grabs
+        img_3d = None
         try:
             self.vtk_widget.GetRenderWindow().Render() # type: ignore
             w2i = vtkWindowToImageFilter() # type: ignore
@@ -1254,6 +1504,12 @@ class MainWindow(QMainWindow):
             writer.SetFileName(preview_path)
             writer.SetInputConnection(w2i.GetOutputPort())
             writer.Write()
+            # 报告直接复用内存中的帧，免去 PNG 落盘再解码
+            from vtk.util.numpy_support import vtk_to_numpy # type: ignore
+
+            img_data = w2i.GetOutput()
+            img_w, img_h = img_data.GetDimensions()[:2]
+            img_3d = vtk_to_numpy(img_data.GetPointData().GetScalars()).reshape(img_h, img_w, -1)[::-1]
         except Exception:
             grab = self.vtk_widget.grab() # type: ignore
             grab.save(preview_path, "PNG")
@@ -1278,27 +1534,35 @@ class MainWindow(QMainWindow):
         # Vector 2D + raster 3D report
         report_path = os.path.join(out_dir, f"report_{ts}.pdf")
         if self._last_polar and self._last_cart:
-            fig = Figure(figsize=(11, 6))
-            canvas = FigureCanvas(fig)
-            gs = fig.add_gridspec(
-                3,
-                3,
-                width_ratios=[1.2, 1.2, 1.0],
-                height_ratios=[0.18, 1.0, 1.0],
-            )
-            ax_header = fig.add_subplot(gs[0, :])
-            ax_polar = fig.add_subplot(gs[1, 0], projection="polar")
-            ax_cart = fig.add_subplot(gs[2, 0:2])
-            ax_3d = fig.add_subplot(gs[1:, 2])
-
-            theta_vals, r_vals, rc_vals, units_primary, units_mirror, turns = self._last_polar
+            # 报告 Figure 只建一次，重复导出时仅清轴重画
+            if self._report_fig is None:
+                fig = Figure(figsize=(11, 6))
+                FigureCanvas(fig)
+                gs = fig.add_gridspec(
+                    3,
+                    3,
+                    width_ratios=[1.2, 1.2, 1.0],
+                    height_ratios=[0.18, 1.0, 1.0],
+                )
+                self._report_fig = fig
+                self._report_axes = (
+                    fig.add_subplot(gs[0, :]),
+                    fig.add_subplot(gs[1, 0], projection="polar"),
+                    fig.add_subplot(gs[2, 0:2]),
+                    fig.add_subplot(gs[1:, 2]),
+                )
+            fig = self._report_fig
+            ax_header, ax_polar, ax_cart, ax_3d = self._report_axes
+            ax_header.clear()
+            ax_3d.clear()
+
+            theta_vals, r_vals, rc_vals, units_primary, turns = self._last_polar
             self._draw_polar_on(
                 ax_polar,
                 theta_vals,
                 r_vals,
                 rc_vals,
                 units_primary,
-                units_mirror,
                 turns,
             )
             primary, mirror, elastic_poly, elastic_poly_mirror = self._last_cart
@@ -1331,7 +1595,7 @@ class MainWindow(QMainWindow):
             ax_header.text(
                 0.01,
                 -0.25,
-                f"Taper={self._taper_angle_deg:.2f}°  Tip={2.0 * max(p[1] for p in self._polys_primary[0]):.2f} mm  Base={self._base_size:.2f} mm  Length={self._robot_length:.2f} mm  Units={len(self._polys_primary)}",
+                f"Taper={self._taper_angle_deg:.2f}°  Tip={2.0 * float(self._polys_primary[0, :, 1].max()):.2f} mm  Base={self._base_size:.2f} mm  Length={self._robot_length:.2f} mm  Units={len(self._polys_primary)}",
                 fontsize=9,
                 color="#555555",
                 va="center",
@@ -1339,15 +1603,14 @@ class MainWindow(QMainWindow):
 
             ax_3d.set_title("3D 模型")
             ax_3d.axis("off")
-            img = mpimg.imread(preview_path)
+            img = img_3d if img_3d is not None else mpimg.imread(preview_path)
             ax_3d.imshow(img)
             fig.tight_layout()
             fig.savefig(report_path, dpi=300)
 
     def export_xml(self) -> None:
-        try:
-            import cadquery as cq
-        except Exception:
+        cq = self._cq
+        if cq is None:
             return
         out_dir = os.path.join(os.path.dirname(__file__), "exports")
         os.makedirs(out_dir, exist_ok=True)
@@ -1356,20 +1619,20 @@ class MainWindow(QMainWindow):
         os.makedirs(xml_dir, exist_ok=True)
 
         # Build only the rightmost unit without elastic layer
-        if not self._polys_primary:
+        if len(self._polys_primary) == 0:
             return
         if self.params.two_cable:
-            thickness = max(0.1, float(self.extrusion_spin.value()))
-            solid = None
+            thickness = self.params.extrusion_clamped
             right_primary = self._polys_primary[-1]
-            right_mirror = self._polys_mirror[-1] if self._polys_mirror else None
-            for poly in (right_primary, right_mirror):
-                if not poly:
-                    continue
-                wp = cq.Workplane("XY").polyline(poly).close().extrude(thickness / 2.0, both=True)
-                solid = wp if solid is None else solid.union(wp)
-            if solid is None:
+            right_mirror = self._polys_mirror[-1] if len(self._polys_mirror) else None
+            parts = [
+                cq.Workplane("XY").polyline(_poly_points(poly)).close().extrude(thickness / 2.0, both=True).val()
+                for poly in (right_primary, right_mirror)
+                if poly is not None
+            ]
+            if not parts:
                 return
+            solid = cq.Workplane("XY").newObject([cq.Compound.makeCompound(parts)])
 
             # Apply cone1 cut on the unit
             cone1 = float(self.cone1_spin.value())
@@ -1384,10 +1647,12 @@ class MainWindow(QMainWindow):
 
                 n1 = (math.sin(alpha), 0.0, math.cos(alpha))
                 n2 = (math.sin(alpha), 0.0, -math.cos(alpha))
+                # atan2(sinα, ±cosα) 就是 ±α，角度直接给出，免去逆三角
+                angle1_deg = math.degrees(alpha)
+                angle2_deg = 180.0 - angle1_deg
 
-                def _cut_halfspace(workpiece, origin, normal):
+                def _cut_halfspace(workpiece, origin, normal, angle):
                     box = cq.Workplane("XY").box(extent, extent, extent, centered=(True, True, True))
-                    angle = math.degrees(math.atan2(normal[0], normal[2]))
                     box = box.rotate((0, 0, 0), (0, 1, 0), angle)
                     box = box.translate((
                         origin[0] + normal[0] * (extent / 2.0),
@@ -1396,8 +1661,8 @@ class MainWindow(QMainWindow):
                     ))
                     return workpiece.cut(box)
 
-                solid = _cut_halfspace(solid, (base_x, 0.0, half_z), n1)
-                solid = _cut_halfspace(solid, (base_x, 0.0, -half_z), n2)
+                solid = _cut_halfspace(solid, (base_x, 0.0, half_z), n1, angle1_deg)
+                solid = _cut_halfspace(solid, (base_x, 0.0, -half_z), n2, angle2_deg)
 
             # Apply cone2 cut on the unit
             cone2_solid = self._build_cone2_preview_solid()
@@ -1409,7 +1674,7 @@ class MainWindow(QMainWindow):
             right_primary = self._polys_primary[-1]
             wp = (
                 cq.Workplane("XY")
-                .polyline(right_primary)
+                .polyline(_poly_points(right_primary))
                 .close()
                 .revolve(360, (0, 0, 0), (1, 0, 0))
             )
@@ -1423,12 +1688,23 @@ class MainWindow(QMainWindow):
 
         stl_name = "baselink.stl"
         stl_path = os.path.join(xml_dir, stl_name)
-        cq.exporters.export(solid.val(), stl_path) # type: ignore
+        try:
+            # 直接走 OCCT 网格器写二进制 STL，比默认 ASCII 导出小且快
+            from OCP.BRepMesh import BRepMesh_IncrementalMesh # type: ignore
+            from OCP.StlAPI import StlAPI_Writer # type: ignore
+
+            shape = solid.val().wrapped # type: ignore
+            BRepMesh_IncrementalMesh(shape, 0.1, False, 0.5, True)
+            writer = StlAPI_Writer()
+            writer.SetASCIIMode(False)
+            writer.Write(shape, stl_path)
+        except Exception:
+            cq.exporters.export(solid.val(), stl_path) # type: ignore
 
         xml_path = os.path.join(xml_dir, "robot.xml")
         # compute unit height from rightmost quad (x-axis segment)
         unit_height = 0.0
-        if self._polys_primary:
+        if len(self._polys_primary):
             pts = [p for p in self._polys_primary[-1] if abs(p[1]) < 1e-6]
             if len(pts) >= 2:
                 unit_height = abs(pts[1][0] - pts[0][0])
@@ -1437,41 +1713,44 @@ class MainWindow(QMainWindow):
         unit_height = max(1e-6, unit_height)
         # compute cable sites based on last unit
         site_points = None
-        if self._polys_primary:
+        if len(self._polys_primary):
             last_poly = self._polys_primary[-1]
             if len(last_poly) >= 4:
-                p0_line = (0.0, self.params.tip_hole_pos * self._tip_size * 0.5)
-                p1_line = (self._robot_length, self.params.base_hole_pos * self._base_size * 0.5)
-                dx = p1_line[0] - p0_line[0]
-                dy = p1_line[1] - p0_line[1]
-                if abs(dx) < 1e-9 and abs(dy) < 1e-9:
-                    dx, dy = 1.0, 0.0
-                length = (dx * dx + dy * dy) ** 0.5
-                dx /= length
-                dy /= length
-                L = 1e6
-                line_a = (p0_line[0] - dx * L, p0_line[1] - dy * L)
-                line_b = (p0_line[0] + dx * L, p0_line[1] + dy * L)
-                left_edge = (last_poly[3], last_poly[0])
-                right_edge = (last_poly[2], last_poly[1])
-                left_hit = _line_segment_intersection(line_a, line_b, left_edge[0], left_edge[1])
-                right_hit = _line_segment_intersection(line_a, line_b, right_edge[0], right_edge[1])
-                if left_hit and right_hit:
-                    x1, y1 = left_hit
-                    x2, y2 = right_hit
-                    site_points = (x1, y1, x2, y2)
+                p0_line = np.array([0.0, self.params.tip_hole_pos * self._tip_size * 0.5])
+                p1_line = np.array([self._robot_length, self.params.base_hole_pos * self._base_size * 0.5])
+                d = p1_line - p0_line
+                if abs(d[0]) < 1e-9 and abs(d[1]) < 1e-9:
+                    d = np.array([1.0, 0.0])
+                # 左/右缘各一条线段，批量解 2x2 线性方程 p0+t·d = e0+s·(e1-e0)
+                edges = np.array([
+                    [last_poly[3], last_poly[0]],
+                    [last_poly[2], last_poly[1]],
+                ])
+                seg = edges[:, 1] - edges[:, 0]
+                A = np.stack([np.broadcast_to(d, seg.shape), -seg], axis=-1)
+                rhs = edges[:, 0] - p0_line
+                try:
+                    ts = np.linalg.solve(A, rhs)
+                except np.linalg.LinAlgError:
+                    ts = None
+                if ts is not None and np.all(np.abs(ts[:, 1] - 0.5) <= 0.5 + 1e-9):
+                    hits = p0_line + ts[:, :1] * d
+                    site_points = (
+                        float(hits[0, 0]), float(hits[0, 1]),
+                        float(hits[1, 0]), float(hits[1, 1]),
+                    )
                 else:
                     # Fallback: compute y on the line at left/right x positions
-                    x1 = left_edge[0][0]
-                    x2 = right_edge[0][0]
-                    if abs(p1_line[0] - p0_line[0]) < 1e-9:
+                    x1 = float(edges[0, 0, 0])
+                    x2 = float(edges[1, 0, 0])
+                    if abs(d[0]) < 1e-9:
                         # vertical in x, use end y values
-                        y1 = p0_line[1]
-                        y2 = p1_line[1]
+                        y1 = float(p0_line[1])
+                        y2 = float(p1_line[1])
                     else:
-                        slope = (p1_line[1] - p0_line[1]) / (p1_line[0] - p0_line[0])
-                        y1 = p0_line[1] + slope * (x1 - p0_line[0])
-                        y2 = p0_line[1] + slope * (x2 - p0_line[0])
+                        slope = d[1] / d[0]
+                        y1 = float(p0_line[1] + slope * (x1 - p0_line[0]))
+                        y2 = float(p0_line[1] + slope * (x2 - p0_line[0]))
                     site_points = (x1, y1, x2, y2)
         gamma = math.exp(self.params.b * math.radians(self.params.dtheta_deg))
         num_units = max(1, len(self._polys_primary))
@@ -1495,9 +1774,8 @@ class MainWindow(QMainWindow):
             return
 
     def export_cad(self) -> None:
-        try:
-            import cadquery as cq
-        except Exception:
+        cq = self._cq
+        if cq is None:
             return
         parts = self._build_cad_parts()
         if parts is None:
@@ -1519,26 +1797,30 @@ class MainWindow(QMainWindow):
         cq.exporters.export(merged.val(), stl_path) # type: ignore
 
     def _build_cad_parts(self):
-        try:
-            import cadquery as cq
-        except Exception:
+        cq = self._cq
+        if cq is None:
             return None
 
         if self.params.two_cable:
-            thickness = max(0.1, float(self.extrusion_spin.value()))
+            thickness = self.params.extrusion_clamped
 
+            # 单元体不相互贴合，makeCompound 一次打包即可，避免 O(N) 次布尔 fuse
+            parts = [
+                cq.Workplane("XY").polyline(_poly_points(poly)).close().extrude(thickness / 2.0, both=True).val()
+                for poly in (*self._polys_primary, *self._polys_mirror)
+            ]
             main = None
-            for poly in (self._polys_primary + self._polys_mirror):
-                wp = cq.Workplane("XY").polyline(poly).close().extrude(thickness / 2.0, both=True)
-                main = wp if main is None else main.union(wp)
-
+            if parts:
+                main = cq.Workplane("XY").newObject([cq.Compound.makeCompound(parts)])
+
+            elastic_parts = [
+                cq.Workplane("XY").polyline(poly).close().extrude(thickness / 2.0, both=True).val()
+                for poly in (self._elastic_poly, self._elastic_poly_mirror)
+                if poly
+            ]
             elastic = None
-            if self._elastic_poly:
-                wp = cq.Workplane("XY").polyline(self._elastic_poly).close().extrude(thickness / 2.0, both=True)
-                elastic = wp if elastic is None else elastic.union(wp)
-            if self._elastic_poly_mirror:
-                wp = cq.Workplane("XY").polyline(self._elastic_poly_mirror).close().extrude(thickness / 2.0, both=True)
-                elastic = wp if elastic is None else elastic.union(wp)
+            if elastic_parts:
+                elastic = cq.Workplane("XY").newObject([cq.Compound.makeCompound(elastic_parts)])
             if main is None:
                 return None
             # Apply cone1 clipping to CAD export
@@ -1556,11 +1838,13 @@ class MainWindow(QMainWindow):
                 # Same two planes as 3D preview
                 n1 = (math.sin(alpha), 0.0, math.cos(alpha))
                 n2 = (math.sin(alpha), 0.0, -math.cos(alpha))
+                # atan2(sinα, ±cosα) 就是 ±α，角度直接给出，免去逆三角
+                angle1_deg = math.degrees(alpha)
+                angle2_deg = 180.0 - angle1_deg
 
-                def _cut_halfspace(workpiece, origin, normal):
+                def _cut_halfspace(workpiece, origin, normal, angle):
                     # Build a large box and remove the side pointed by normal
                     box = cq.Workplane("XY").box(extent, extent, extent, centered=(True, True, True))
-                    angle = math.degrees(math.atan2(normal[0], normal[2]))
                     box = box.rotate((0, 0, 0), (0, 1, 0), angle)
                     box = box.translate((
                         origin[0] + normal[0] * (extent / 2.0),
@@ -1569,23 +1853,17 @@ class MainWindow(QMainWindow):
                     ))
                     return workpiece.cut(box)
 
-                main = _cut_halfspace(main, (base_x, 0.0, half_z), n1)
-                main = _cut_halfspace(main, (base_x, 0.0, -half_z), n2)
+                main = _cut_halfspace(main, (base_x, 0.0, half_z), n1, angle1_deg)
+                main = _cut_halfspace(main, (base_x, 0.0, -half_z), n2, angle2_deg)
+                if elastic is not None:
+                    elastic = _cut_halfspace(elastic, (base_x, 0.0, half_z), n1, angle1_deg)
+                    elastic = _cut_halfspace(elastic, (base_x, 0.0, -half_z), n2, angle2_deg)
+
+            holes = self._frustum_hole_compound((0.0, 180.0))
+            if holes is not None:
+                main = main.cut(holes)
                 if elastic is not None:
-                    elastic = _cut_halfspace(elastic, (base_x, 0.0, half_z), n1)
-                    elastic = _cut_halfspace(elastic, (base_x, 0.0, -half_z), n2)
-
-            frustum = self._build_frustum_solid()
-            if frustum is not None:
-                angles = [0.0, 180.0]
-                holes = None
-                for ang in angles:
-                    inst = frustum if ang == 0.0 else frustum.rotate((0, 0, 0), (1, 0, 0), ang)
-                    holes = inst if holes is None else holes.union(inst)
-                if holes is not None:
-                    main = main.cut(holes)
-                    if elastic is not None:
-                        elastic = elastic.cut(holes)
+                    elastic = elastic.cut(holes)
 
             cone2_solid = self._build_cone2_preview_solid()
             if cone2_solid is not None:
@@ -1595,32 +1873,19 @@ class MainWindow(QMainWindow):
 
             return (main, elastic)
 
-        solid = None
+        # 所有截面共用 X 轴旋转：先把闭合线框攒到同一个工作平面，
+        # 一次 revolve 出整体，免去逐截面旋转再打包
+        wp = cq.Workplane("XY")
         for poly in self._polys_primary:
-            wp = (
-                cq.Workplane("XY")
-                .polyline(poly)
-                .close()
-                .revolve(360, (0, 0, 0), (1, 0, 0))
-            )
-            solid = wp if solid is None else solid.union(wp)
+            wp = wp.polyline(_poly_points(poly)).close()
         if self._elastic_poly:
-            wp = (
-                cq.Workplane("XY")
-                .polyline(self._elastic_poly)
-                .close()
-                .revolve(360, (0, 0, 0), (1, 0, 0))
-            )
-            solid = wp if solid is None else solid.union(wp)
-        frustum = self._build_frustum_solid()
-        if frustum is not None:
-            angles = [0.0, 120.0, 240.0]
-            holes = None
-            for ang in angles:
-                inst = frustum if ang == 0.0 else frustum.rotate((0, 0, 0), (1, 0, 0), ang)
-                holes = inst if holes is None else holes.union(inst)
-            if holes is not None:
-                solid = solid.cut(holes) # type: ignore
+            wp = wp.polyline(self._elastic_poly).close()
+        solid = None
+        if len(self._polys_primary) or self._elastic_poly:
+            solid = wp.revolve(360, (0, 0, 0), (1, 0, 0))
+        holes = self._frustum_hole_compound((0.0, 120.0, 240.0))
+        if holes is not None:
+            solid = solid.cut(holes) # type: ignore
         return (solid, None)
 
 
@@ -3,36 +3,14 @@
 XML Generator for MuJoCo Simulation
 Generates robot.xml for soft robot simulation
 """
+import hashlib
+import os
+from xml.sax.saxutils import escape
 
-def generate_mujoco_xml(
-    xml_path: str,
-    stl_name: str,
-    unit_height: float,
-    scale: float,
-    num_units: int,
-    joint_type: str,
-    joint_limit_deg: float,
-    robot_length: float,
-    site_points: tuple | None,
-    cable_mode: int = 2,
-) -> None:
-    """
-    Generate MuJoCo XML file for spiral robot simulation
-    
-    Args:
-        xml_path: Output XML file path
-        stl_name: STL mesh filename
-        unit_height: Height of each unit segment
-        scale: Scaling factor between units
-        num_units: Number of robot units
-        joint_type: "hinge" for 2-cable or "ball" for 3-cable
-        joint_limit_deg: Joint angle limit in degrees
-        robot_length: Total robot length
-        site_points: Cable attachment points (x1, y1, x2, y2)
-        cable_mode: 2 for 2-cable, 3 for 3-cable
-    """
-    
-    xml_content = f'''<?xml version="1.0" encoding="utf-8"?>
+import numpy as np
+
+# 头尾中与参数无关的大块字面量提升为模块常量，每次调用只需格式化两行动态内容
+_HEADER_TOP = '''<?xml version="1.0" encoding="utf-8"?>
 <mujoco model="spiral_robot">
     <compiler angle="radian" meshdir="." />
     
@@ -47,8 +25,9 @@ def generate_mujoco_xml(
     </visual>
     
     <asset>
-        <mesh name="unit_mesh" file="{stl_name}" scale="{scale:.6f} {scale:.6f} {scale:.6f}" />
-        <texture name="groundplane" type="2d" builtin="checker" rgb1=".2 .3 .4" rgb2=".1 .2 .3" 
+'''
+
+_HEADER_MID = '''        <texture name="groundplane" type="2d" builtin="checker" rgb1=".2 .3 .4" rgb2=".1 .2 .3" 
                  width="100" height="100" mark="cross" markrgb=".8 .8 .8" />
         <material name="groundplane" texture="groundplane" texrepeat="5 5" texuniform="true" reflectance=".2" />
         <material name="robot" rgba="0.6 0.7 0.9 1" />
@@ -60,72 +39,240 @@ def generate_mujoco_xml(
         <geom name="ground" type="plane" size="10 10 0.1" material="groundplane" />
         
         <!-- Base anchor -->
-        <body name="base" pos="0 0 {unit_height:.6f}">
-            <geom name="base_geom" type="box" size="0.05 0.05 0.05" rgba="0.8 0.2 0.2 1" />
+'''
+
+_HEADER_TAIL = '''            <geom name="base_geom" type="box" size="0.05 0.05 0.05" rgba="0.8 0.2 0.2 1" />
             <inertial pos="0 0 0" mass="0.1" diaginertia="0.001 0.001 0.001" />
 '''
+
+_WORLDBODY_CLOSE = '''        </body>
+    </worldbody>
     
-    # Generate robot link chain
-    current_body = "base"
-    for i in range(num_units):
-        unit_scale = scale ** i
-        xml_content += f'''
+    <actuator>
+'''
+
+_TRAILER = '''    </actuator>
+    
+</mujoco>
+'''
+
+# 每单元的 XML 片段模板：模块级只编译一次，循环里仅做 .format 填数。
+# 数值字段接收已格式化好的字符串（批量转换见 generate_mujoco_xml）
+_UNIT_TPL = '''
             <!-- Unit {i} -->
-            <body name="link_{i}" pos="{unit_height * unit_scale:.6f} 0 0">
+            <body name="link_{i}" pos="{pos_x} 0 0">
                 <geom name="geom_{i}" type="mesh" mesh="unit_mesh" material="robot" />
-                <inertial pos="{unit_height * unit_scale * 0.5:.6f} 0 0" mass="{0.01 * unit_scale:.6f}" 
-                          diaginertia="{0.0001 * unit_scale:.6f} {0.0001 * unit_scale:.6f} {0.0001 * unit_scale:.6f}" />
+                <inertial pos="{half} 0 0" mass="{mass}" 
+                          diaginertia="{inertia} {inertia} {inertia}" />
                 
                 <!-- Joint -->
                 <joint name="joint_{i}" type="{joint_type}" axis="0 0 1" 
-                       limited="true" range="-{joint_limit_deg * 0.01745:.6f} {joint_limit_deg * 0.01745:.6f}" 
+                       limited="true" range="-{jl_rad} {jl_rad}" 
                        damping="0.1" stiffness="0.5" />
                 
                 <!-- Cable attachment sites -->
 '''
-        
-        if site_points and cable_mode == 2:
-            x1, y1, x2, y2 = site_points
-            xml_content += f'''                <site name="cable1_unit{i}" pos="{x1 * unit_scale:.6f} {y1 * unit_scale:.6f} 0" size="0.01" />
-                <site name="cable2_unit{i}" pos="{x2 * unit_scale:.6f} {y2 * unit_scale:.6f} 0" size="0.01" />
-'''
-        elif cable_mode == 3:
-            radius = robot_length * 0.1
-            xml_content += f'''                <site name="cable1_unit{i}" pos="{unit_height * unit_scale * 0.5:.6f} {radius * unit_scale:.6f} 0" size="0.01" />
-                <site name="cable2_unit{i}" pos="{unit_height * unit_scale * 0.5:.6f} {-radius * unit_scale * 0.5:.6f} {radius * unit_scale * 0.866:.6f}" size="0.01" />
-                <site name="cable3_unit{i}" pos="{unit_height * unit_scale * 0.5:.6f} {-radius * unit_scale * 0.5:.6f} {-radius * unit_scale * 0.866:.6f}" size="0.01" />
+
+_SITE2_TPL = '''                <site name="cable1_unit{i}" pos="{sx1} {sy1} 0" size="0.01" />
+                <site name="cable2_unit{i}" pos="{sx2} {sy2} 0" size="0.01" />
 '''
-        
-        current_body = f"link_{i}"
-    
-    # Close all body tags
-    for i in range(num_units + 1):
-        xml_content += '            </body>\n'
-    
-    xml_content += '''        </body>
-    </worldbody>
-    
-    <actuator>
+
+_SITE3_TPL = '''                <site name="cable1_unit{i}" pos="{half} {radius_s} 0" size="0.01" />
+                <site name="cable2_unit{i}" pos="{half} {neg_r_half} {r_866}" size="0.01" />
+                <site name="cable3_unit{i}" pos="{half} {neg_r_half} {neg_r_866}" size="0.01" />
 '''
-    
-    # Add cable actuators
-    for i in range(num_units):
-        if cable_mode == 2:
-            xml_content += f'''        <position name="cable1_act{i}" site="cable1_unit{i}" kp="100" kv="10" />
+
+_UNIT2_TPL = _UNIT_TPL + _SITE2_TPL
+_UNIT3_TPL = _UNIT_TPL + _SITE3_TPL
+
+_ACT2_TPL = '''        <position name="cable1_act{i}" site="cable1_unit{i}" kp="100" kv="10" />
         <position name="cable2_act{i}" site="cable2_unit{i}" kp="100" kv="10" />
 '''
-        elif cable_mode == 3:
-            xml_content += f'''        <position name="cable1_act{i}" site="cable1_unit{i}" kp="100" kv="10" />
+
+_ACT3_TPL = '''        <position name="cable1_act{i}" site="cable1_unit{i}" kp="100" kv="10" />
         <position name="cable2_act{i}" site="cable2_unit{i}" kp="100" kv="10" />
         <position name="cable3_act{i}" site="cable3_unit{i}" kp="100" kv="10" />
 '''
+
+# 同一路径上次写出内容的哈希：内容未变时跳过磁盘写，参数滑条抖动零成本
+_last_xml_hash: dict = {}
+
+
+def _f6(x: float) -> str:
+    # 定点 .6f 的整数化快速路径：一次 round 进整数域，字符串切片补小数点，
+    # 避开通用 double→decimal 转换。仅用于非负标量（数组字段走批量转换）
+    n = round(x * 1_000_000)
+    s = f"{n:07d}" if n >= 0 else f"-{-n:07d}"
+    return f"{s[:-6]}.{s[-6:]}"
+
+
+def generate_mujoco_xml(
+    xml_path: str,
+    stl_name: str,
+    unit_height: float,
+    scale: float,
+    num_units: int,
+    joint_type: str,
+    joint_limit_deg: float,
+    robot_length: float,
+    site_points: tuple | None,
+    cable_mode: int = 2,
+) -> None:
+    """
+    Generate MuJoCo XML file for spiral robot simulation
     
-    xml_content += '''    </actuator>
-    
-</mujoco>
-'''
-    
-    with open(xml_path, 'w', encoding='utf-8') as f:
-        f.write(xml_content)
+    Args:
+        xml_path: Output XML file path
+        stl_name: STL mesh filename
+        unit_height: Height of each unit segment
+        scale: Scaling factor between units
+        num_units: Number of robot units
+        joint_type: "hinge" for 2-cable or "ball" for 3-cable
+        joint_limit_deg: Joint angle limit in degrees
+        robot_length: Total robot length
+        site_points: Cable attachment points (x1, y1, x2, y2)
+        cable_mode: 2 for 2-cable, 3 for 3-cable
+
+    Raises:
+        ValueError: if num_units is outside (0, 10000] or scale is
+            outside (0, 1.5] — guards against runaway generation
+    """
+
+    # 病态输入先挡掉：1e6 个单元或发散的 scale 会拖垮内存与墙钟
+    if not 0 < num_units <= 10_000:
+        raise ValueError(f"num_units out of range (0, 10000]: {num_units}")
+    if not 0.0 < scale <= 1.5:
+        raise ValueError(f"scale out of range (0, 1.5]: {scale}")
+
+    # stl_name 是唯一的自由文本属性，按 XML 规则转义后再插入
+    stl_name = escape(stl_name, {'"': '&quot;'})
+
+    # 片段先攒在列表里，结尾 join 一次成串，便于对整体内容做哈希去重；
+    # 逐单元片段用列表推导整块 extend，绕开每圈的方法调用
+    parts = []
+    w = parts.append
+    scale_s = _f6(scale)
+    w(_HEADER_TOP)
+    w(f'        <mesh name="unit_mesh" file="{stl_name}" scale="{scale_s} {scale_s} {scale_s}" />\n')
+    w(_HEADER_MID)
+    w(f'        <body name="base" pos="0 0 {_f6(unit_height)}">\n')
+    w(_HEADER_TAIL)
     
+    # Generate robot link chain
+    # 逐单元标量全部向量化：unit_scale 等比数列一次算完，
+    # %.6f 浮点转字符串按列批量完成（np.char.mod 走 C 层），循环体只剩纯字符串拼装。
+    # cable_mode 在整次调用中固定，按模式各写一条专用循环，循环体内不再分支
+    jl_s = _f6(joint_limit_deg * 0.01745)
+    unit_scale = np.power(scale, np.arange(num_units))
+    pos_x_s = np.char.mod('%.6f', unit_height * unit_scale)
+    half_s = np.char.mod('%.6f', unit_height * unit_scale * 0.5)
+    mass_s = np.char.mod('%.6f', 0.01 * unit_scale)
+    inertia_s = np.char.mod('%.6f', 0.0001 * unit_scale)
+    if site_points and cable_mode == 2:
+        x1, y1, x2, y2 = site_points
+        sx1_s = np.char.mod('%.6f', x1 * unit_scale)
+        sy1_s = np.char.mod('%.6f', y1 * unit_scale)
+        sx2_s = np.char.mod('%.6f', x2 * unit_scale)
+        sy2_s = np.char.mod('%.6f', y2 * unit_scale)
+        parts.extend([
+            _UNIT2_TPL.format(
+                i=i,
+                pos_x=pos_x_s[i],
+                half=half_s[i],
+                mass=mass_s[i],
+                inertia=inertia_s[i],
+                joint_type=joint_type,
+                jl_rad=jl_s,
+                sx1=sx1_s[i],
+                sy1=sy1_s[i],
+                sx2=sx2_s[i],
+                sy2=sy2_s[i],
+            )
+            for i in range(num_units)
+        ])
+    elif cable_mode == 3:
+        radius_s = robot_length * 0.1 * unit_scale
+        radius_ss = np.char.mod('%.6f', radius_s)
+        neg_r_half_s = np.char.mod('%.6f', -(radius_s * 0.5))
+        r_866_s = np.char.mod('%.6f', radius_s * 0.866)
+        neg_r_866_s = np.char.mod('%.6f', -(radius_s * 0.866))
+        parts.extend([
+            _UNIT3_TPL.format(
+                i=i,
+                pos_x=pos_x_s[i],
+                half=half_s[i],
+                mass=mass_s[i],
+                inertia=inertia_s[i],
+                joint_type=joint_type,
+                jl_rad=jl_s,
+                radius_s=radius_ss[i],
+                neg_r_half=neg_r_half_s[i],
+                r_866=r_866_s[i],
+                neg_r_866=neg_r_866_s[i],
+            )
+            for i in range(num_units)
+        ])
+    else:
+        parts.extend([
+            _UNIT_TPL.format(
+                i=i,
+                pos_x=pos_x_s[i],
+                half=half_s[i],
+                mass=mass_s[i],
+                inertia=inertia_s[i],
+                joint_type=joint_type,
+                jl_rad=jl_s,
+            )
+            for i in range(num_units)
+        ])
+
+    # Close all body tags（一次字符串乘法，单次写出）
+    w('            </body>\n' * (num_units + 1))
+
+    w(_WORLDBODY_CLOSE)
+
+    # Add cable actuators（join 一次拼出整块，结果缓冲区单次分配）
+    if cable_mode == 2:
+        w(''.join([_ACT2_TPL.format(i=i) for i in range(num_units)]))
+    elif cable_mode == 3:
+        w(''.join([_ACT3_TPL.format(i=i) for i in range(num_units)]))
+
+    w(_TRAILER)
+
+    # 整体只编码一次，哈希与落盘共用同一份 bytes；
+    # 裸 fd 单次 os.write，绕开 TextIOWrapper 的增量编码与换行翻译
+    data = ''.join(parts).encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if _last_xml_hash.get(xml_path) == digest and os.path.exists(xml_path):
+        return
+
+    fd = os.open(xml_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    _last_xml_hash[xml_path] = digest
+
     print(f"Generated MuJoCo XML: {xml_path}")
+
+
+def _gen_one(config: dict) -> None:
+    # ProcessPoolExecutor 只能投递模块级可 pickle 的函数，故单独成函数
+    generate_mujoco_xml(**config)
+
+
+def generate_mujoco_xml_batch(configs: list) -> None:
+    """
+    Generate many MuJoCo XML files in parallel (e.g. parameter sweeps)
+
+    Args:
+        configs: One kwargs dict per generate_mujoco_xml call
+    """
+    if not configs:
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 各配置互不相关，按进程并行；chunksize 摊薄任务投递的 IPC 开销
+    chunksize = max(1, len(configs) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_gen_one, configs, chunksize=chunksize))